@@ -20,18 +20,25 @@ Hard guarantees:
   - --verify_replay produces byte-identical outputs across REPLAY_A and REPLAY_B
 """
 
-import argparse
-import csv
+import filecmp
+import functools
 import hashlib
+import operator
 import os
 import shutil
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 
 VERSION = "v0.3.0"
 ENGINE_TAG = "SSP_DEMO__V03"
 
+# One trace row, pre-joined and ASCII-encoded: b"step|layer|event|x|gate"
+Row = bytes
+
+# run_case result: (decision, actual_sig, stats, dist, {file name: sha256})
+CaseResult = Tuple[str, str, Dict[str, int], Dict[str, int], Dict[str, str]]
+
 
 # ----------------------------
 # Utilities
@@ -41,17 +48,6 @@ def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
-def sha256_file(path: str) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
@@ -61,30 +57,54 @@ def rm_tree(path: str) -> None:
         shutil.rmtree(path)
 
 
-def write_text(path: str, text: str) -> None:
-    # Force stable newlines and encoding
-    with open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(text)
+def write_bytes_hashed(path: str, *chunks: bytes) -> str:
+    # Writes the chunks in order and returns the SHA-256 of exactly what was
+    # written, so the manifest never has to read the file back. Passing
+    # chunks avoids concatenating them into one buffer first.
+    h = hashlib.sha256()
+    with open(path, "wb") as f:
+        for c in chunks:
+            h.update(c)
+            f.write(c)
+    return h.hexdigest()
+
 
+def write_text_hashed(path: str, text: str) -> str:
+    # Stable UTF-8 encoding; text already uses '\n' newlines
+    return write_bytes_hashed(path, text.encode("utf-8"))
 
-def write_csv(path: str, header: List[str], rows: List[List[str]]) -> None:
+
+def write_csv_hashed(path: str, header: List[str], blob: bytes) -> str:
     # Force stable CSV output across platforms:
     # - newline="\n"
-    # - lineterminator="\n"
-    with open(path, "w", encoding="utf-8", newline="\n") as f:
-        w = csv.writer(f, lineterminator="\n")
-        w.writerow(header)
-        for r in rows:
-            w.writerow(r)
+    # - header + trace body written straight from the canonical trace blob
+    # Trace fields are integers or fixed identifiers (no commas, quotes,
+    # '|' or newlines), so no CSV quoting is ever required and the '|'
+    # row separators map one-to-one onto ','.
+    head = (",".join(header) + "\n").encode("ascii")
+    if not blob:
+        return write_bytes_hashed(path, head)
+    return write_bytes_hashed(path, head, blob.replace(b"|", b","), b"\n")
+
+
+def _scan_relpaths(path: str, prefix: str) -> Iterator[str]:
+    # Same classification as os.walk (unreadable dirs skipped, symlinked
+    # dirs neither listed nor followed), but reuses the d_type cached by
+    # scandir instead of a stat per entry.
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            if not e.is_dir():
+                yield prefix + e.name
+            elif not e.is_symlink():
+                yield from _scan_relpaths(e.path, prefix + e.name + "/")
 
 
 def stable_relpaths(root: str) -> List[str]:
-    rels: List[str] = []
-    for dirpath, _, filenames in os.walk(root):
-        for fn in filenames:
-            full = os.path.join(dirpath, fn)
-            rel = os.path.relpath(full, root).replace("\\", "/")
-            rels.append(rel)
+    rels = list(_scan_relpaths(root, ""))
     rels.sort()
     return rels
 
@@ -95,14 +115,14 @@ def compare_trees(a_root: str, b_root: str) -> Tuple[bool, str]:
     if a_files != b_files:
         return False, "file list mismatch"
 
-    for rel in a_files:
-        ap = os.path.join(a_root, rel.replace("/", os.sep))
-        bp = os.path.join(b_root, rel.replace("/", os.sep))
-        with open(ap, "rb") as fa:
-            ab = fa.read()
-        with open(bp, "rb") as fb:
-            bb = fb.read()
-        if ab != bb:
+    # Byte comparison (size pre-check, chunked reads) without loading whole files.
+    # The stat-keyed filecmp cache is cleared so rewritten trees are always re-read.
+    common = [rel.replace("/", os.sep) for rel in a_files]
+    filecmp.clear_cache()
+    _, mismatch, errors = filecmp.cmpfiles(a_root, b_root, common, shallow=False)
+    bad = set(mismatch) | set(errors)
+    for rel, native in zip(a_files, common):
+        if native in bad:
             return False, f"byte mismatch at {rel}"
     return True, ""
 
@@ -111,28 +131,66 @@ def compare_trees(a_root: str, b_root: str) -> Tuple[bool, str]:
 # Structural posture (SSP-T)
 # ----------------------------
 
+@functools.lru_cache(maxsize=64)
 def posture_signature(posture_id: int, modulus: int = 1000003) -> str:
     # Deterministic posture signature (not wall-clock, not OTP).
+    # Pure in (posture_id, modulus), so repeated cases reuse the digest.
     payload = f"SSP_T|p={posture_id}|mod={modulus}".encode("utf-8")
     return sha256_bytes(payload)
 
 
+@functools.lru_cache(maxsize=64)
 def posture_salt(posture_sig: str) -> int:
     # Deterministic salt from signature prefix
     return int(posture_sig[:16], 16)
 
 
+# ----------------------------
+# Event encoding
+# ----------------------------
+
+# The traversal core records small integer ids; names are restored only when
+# rows are materialized for the CSV / signature.
+LAYER_NAMES = ("L0", "L1", "L2", "L3")
+EVENT_NAMES = ("GATE_PASS", "GATE_HOLD", "STEP_ACCEL", "STEP_NORM",
+               "REFUSAL", "REROUTE", "FLOW", "EXIT", "KEEP")
+GATE_NAMES = ("G0_OK", "G0_HOLD", "L1_A", "L1_N",
+              "L2_R", "L2_RR", "L2_F", "L3_E", "L3_K")
+
+L0, L1, L2, L3 = range(4)
+(EV_GATE_PASS, EV_GATE_HOLD, EV_STEP_ACCEL, EV_STEP_NORM,
+ EV_REFUSAL, EV_REROUTE, EV_FLOW, EV_EXIT, EV_KEEP) = range(9)
+# Every event belongs to one layer and has exactly one gate marker
+# (GATE_NAMES is indexed by event id), so the event id alone identifies a row.
+EVENT_LAYER = (L0, L0, L1, L1, L2, L2, L2, L3, L3)
+
+# Pre-encoded row fragments: b"layer|event" and b"gate" per event id
+EVENT_FIELDS = tuple(f"{LAYER_NAMES[EVENT_LAYER[e]]}|{EVENT_NAMES[e]}".encode("ascii")
+                     for e in range(len(EVENT_NAMES)))
+GATE_FIELDS = tuple(g.encode("ascii") for g in GATE_NAMES)
+ROW_FORMAT = b"%d|%s|%d|%s"
+
+
 # ----------------------------
 # Deterministic traversal engine
 # ----------------------------
 
-def traverse(m: int, horizon_steps: int, salt: int) -> Tuple[List[List[str]], Dict[str, int]]:
+def _traverse_core(m: int,
+                   horizon_steps: int,
+                   salt: int,
+                   out_step: List[int],
+                   out_event: List[int],
+                   out_x: List[int],
+                   counts: List[int]) -> int:
     """
-    Deterministic multi-layer traversal producing a canonical event stream.
-
-    Output:
-      - rows for ssp_trace.csv
-      - stats dict
+    Numeric traversal core. Appends one entry per event to each column,
+    bumps counts[event] for each event, and returns the number of events
+    written. Nothing is sized from horizon_steps: the walk usually stops at
+    EXIT long before the horizon.
+
+    The layers form one serial recurrence: a REROUTE folds s2 back into x and
+    s0, the next step's L0 gate reads both, and EXIT ends the walk early, so
+    no per-layer update can be precomputed across steps.
     """
     # Multi-layer state
     x = (m ^ salt) & 0x7FFFFFFF
@@ -141,113 +199,156 @@ def traverse(m: int, horizon_steps: int, salt: int) -> Tuple[List[List[str]], Di
     s2 = (m ^ (salt >> 3)) & 0xFFFFFFFF
     s3 = (m + (salt >> 7)) & 0xFFFFFFFF
 
-    counts: Dict[str, int] = {}
-    rows: List[List[str]] = []
+    # Bound appends: the columns grow with the trace
+    step_append = out_step.append
+    event_append = out_event.append
+    x_append = out_x.append
 
-    def emit(step: int, layer: str, event: str, gate: str) -> None:
-        key = f"{layer}:{event}"
-        counts[key] = counts.get(key, 0) + 1
-        # Keep x visible for audit (still deterministic)
-        rows.append([str(step), layer, event, str(x), gate])
-
-    # Deterministic gates
-    def gate_pass(name: str, v: int, mod: int, target: int) -> bool:
-        return (v % mod) == target
+    # Loop invariants, computed once per trace instead of every step
+    salt_lo = salt & 0xFFFF
+    salt_32 = salt & 0xFFFFFFFF
+    salt_hi11 = salt >> 11
+    lcg_a = 1103515245
+    knuth = 2654435761
 
+    # Deterministic gates are inlined as (v % mod) == target with literal moduli
     for step in range(horizon_steps):
         # Layer 0: admissibility gates
-        g0_ok = gate_pass("G0", s0 + x + step, 17, 0) or gate_pass("G0b", s0 ^ x, 19, 1)
-        if g0_ok:
-            emit(step, "L0", "GATE_PASS", "G0_OK")
+        step_append(step)
+        x_append(x)
+        if (s0 + x + step) % 17 == 0 or (s0 ^ x) % 19 == 1:
+            event_append(EV_GATE_PASS)
+            counts[EV_GATE_PASS] += 1
         else:
-            emit(step, "L0", "GATE_HOLD", "G0_HOLD")
+            event_append(EV_GATE_HOLD)
+            counts[EV_GATE_HOLD] += 1
 
         # Layer 1: bounded evolution loop
         # deterministic update
-        x = (x * 1103515245 + 12345 + (salt & 0xFFFF) + step) & 0x7FFFFFFF
-        s1 = (s1 + (x ^ (step * 2654435761 & 0xFFFFFFFF))) & 0xFFFFFFFF
-        if gate_pass("L1", s1 + x, 29, 0):
-            emit(step, "L1", "STEP_ACCEL", "L1_A")
+        x = (x * lcg_a + 12345 + salt_lo + step) & 0x7FFFFFFF
+        s1 = (s1 + (x ^ (step * knuth & 0xFFFFFFFF))) & 0xFFFFFFFF
+        step_append(step)
+        x_append(x)
+        if (s1 + x) % 29 == 0:
+            event_append(EV_STEP_ACCEL)
+            counts[EV_STEP_ACCEL] += 1
         else:
-            emit(step, "L1", "STEP_NORM", "L1_N")
+            event_append(EV_STEP_NORM)
+            counts[EV_STEP_NORM] += 1
 
         # Layer 2: refusal / reroute posture (collapse-capable)
         # collapse witness: when a deterministic condition hits, emit refusal markers
-        s2 = (s2 ^ (x >> 5) ^ (salt & 0xFFFFFFFF) ^ step) & 0xFFFFFFFF
-        if gate_pass("L2", s2, 31, 7):
-            emit(step, "L2", "REFUSAL", "L2_R")
+        s2 = (s2 ^ (x >> 5) ^ salt_32 ^ step) & 0xFFFFFFFF
+        step_append(step)
+        x_append(x)
+        if s2 % 31 == 7:
+            event_append(EV_REFUSAL)
+            counts[EV_REFUSAL] += 1
             # deterministic reroute: adjust x/s0 to simulate structural reroute
             x = (x ^ (s2 & 0xFFFF) ^ 0xA5A5) & 0x7FFFFFFF
             s0 = (s0 + 97 + (x & 0xFF)) & 0xFFFFFFFF
-            emit(step, "L2", "REROUTE", "L2_RR")
+            step_append(step)
+            x_append(x)
+            event_append(EV_REROUTE)
+            counts[EV_REROUTE] += 1
         else:
-            emit(step, "L2", "FLOW", "L2_F")
+            event_append(EV_FLOW)
+            counts[EV_FLOW] += 1
 
         # Layer 3: closure posture
-        s3 = (s3 + (x & 0xFFFF) + (salt >> 11) + step) & 0xFFFFFFFF
-        if gate_pass("L3", s3 ^ x, 23, 5):
-            emit(step, "L3", "EXIT", "L3_E")
+        s3 = (s3 + (x & 0xFFFF) + salt_hi11 + step) & 0xFFFFFFFF
+        step_append(step)
+        x_append(x)
+        if (s3 ^ x) % 23 == 5:
+            event_append(EV_EXIT)
+            counts[EV_EXIT] += 1
             # Deterministic early closure (bounded)
             break
-        else:
-            emit(step, "L3", "KEEP", "L3_K")
+        event_append(EV_KEEP)
+        counts[EV_KEEP] += 1
+
+    return len(out_event)
+
+
+def traverse(m: int, horizon_steps: int, salt: int) -> Tuple[List[Row], List[int], Dict[str, int]]:
+    """
+    Deterministic multi-layer traversal producing a canonical event stream.
+
+    Output:
+      - rows for ssp_trace.csv
+      - event-type histogram (one bin per event id)
+      - stats dict
+    """
+    # Columns grow with the trace, never with the horizon. Plain lists:
+    # list.append is cheaper than array.array.append
+    out_step: List[int] = []
+    out_event: List[int] = []
+    out_x: List[int] = []
+    counts = [0] * len(EVENT_NAMES)
+
+    n = _traverse_core(m, horizon_steps, salt, out_step, out_event, out_x, counts)
+
+    # Materialize rows once, straight to bytes from the pre-encoded fragments
+    rows: List[Row] = [ROW_FORMAT % (s, EVENT_FIELDS[e], x, GATE_FIELDS[e])
+                       for s, e, x in zip(out_step, out_event, out_x)]
 
     # Stats
     stats = {
-        "steps_executed": (int(rows[-1][0]) + 1) if rows else 0,
-        "events_total": len(rows),
+        "steps_executed": (out_step[n - 1] + 1) if n else 0,
+        "events_total": n,
     }
-    # Layer counts
-    for k, v in counts.items():
-        stats[f"count_{k}"] = v
+    # Layer counts (non-zero bins only)
+    for ev, n_ev in enumerate(counts):
+        if n_ev:
+            stats[f"count_{LAYER_NAMES[EVENT_LAYER[ev]]}:{EVENT_NAMES[ev]}"] = n_ev
 
-    return rows, stats
+    return rows, counts, stats
 
 
-def trace_signature(rows: List[List[str]]) -> str:
+def trace_blob(rows: List[Row]) -> bytes:
     # Canonical serialization (stable)
     # Exclude CSV header. Join by '\n' with '|' separators.
-    lines = []
-    for r in rows:
-        lines.append("|".join(r))
-    blob = ("\n".join(lines) + "\n").encode("utf-8")
-    return sha256_bytes(blob)
+    # The final '\n' is left off so the signature and the CSV writer can
+    # each append it without copying the blob.
+    return b"\n".join(rows)
+
 
+def trace_signature(blob: bytes) -> str:
+    # SHA-256 of the canonical serialization (trace_blob output + final '\n')
+    h = hashlib.sha256(blob)
+    h.update(b"\n")
+    return h.hexdigest()
+
+
+class ExpectedTrace(NamedTuple):
+    """
+    Enrollment trace, computed once per demo and shared by every case.
+    """
+    rows: List[Row]
+    hist: List[int]
+    sig: str
 
-def distance_metrics(expected_rows: List[List[str]], actual_rows: List[List[str]]) -> Dict[str, int]:
+
+def expected_trace(rows: List[Row], hist: List[int]) -> ExpectedTrace:
+    return ExpectedTrace(rows=rows, hist=hist, sig=trace_signature(trace_blob(rows)))
+
+
+def distance_metrics(expected: ExpectedTrace,
+                     actual_rows: List[Row],
+                     actual_hist: List[int]) -> Dict[str, int]:
     # Deterministic audit-only metrics (not used for thresholds)
+    expected_rows = expected.rows
     exp_len = len(expected_rows)
     act_len = len(actual_rows)
-    overlap = min(exp_len, act_len)
-
-    first_div = 0
-    div_in_overlap = 0
-    found_first = False
-
-    # Event-type histogram L1 distance (counts over "layer:event")
-    def hist(rows: List[List[str]]) -> Dict[str, int]:
-        h: Dict[str, int] = {}
-        for r in rows:
-            key = f"{r[1]}:{r[2]}"
-            h[key] = h.get(key, 0) + 1
-        return h
-
-    eh = hist(expected_rows)
-    ah = hist(actual_rows)
-    keys = sorted(set(eh.keys()) | set(ah.keys()))
-    l1 = 0
-    for k in keys:
-        l1 += abs(eh.get(k, 0) - ah.get(k, 0))
-
-    for i in range(overlap):
-        if expected_rows[i] != actual_rows[i]:
-            div_in_overlap += 1
-            if not found_first:
-                first_div = i + 1  # 1-based
-                found_first = True
-
-    if not found_first:
-        first_div = 0
+
+    # Event-type histogram L1 distance (counts over "layer:event"); both
+    # histograms come straight from traverse() with one bin per event id
+    l1 = sum(map(abs, map(operator.sub, expected.hist, actual_hist)))
+
+    # Row-wise divergence over the overlap (map stops at the shorter trace)
+    diff = list(map(operator.ne, expected_rows, actual_rows))
+    div_in_overlap = sum(diff)
+    first_div = (diff.index(True) + 1) if div_in_overlap else 0  # 1-based
 
     return {
         "first_div_step": first_div,
@@ -287,14 +388,52 @@ def build_config_text(mode: str,
     )
 
 
-def write_manifest(folder: str, files: List[str]) -> None:
+def build_summary_text(case_name: str,
+                       decision: str,
+                       reason: str,
+                       m: int,
+                       horizon_steps: int,
+                       posture_id: int,
+                       posture_sig: str,
+                       expected_posture_sig: str,
+                       expected_sig: str,
+                       actual_sig: str,
+                       dist: Dict[str, int],
+                       stats: Dict[str, int]) -> str:
+    return (
+        f"SSP Demo {VERSION} — {case_name}\n"
+        f"decision = {decision}\n"
+        f"reason = {reason}\n"
+        f"m = {m}\n"
+        f"horizon_steps = {horizon_steps}\n"
+        f"posture_id = {posture_id}\n"
+        f"posture_sig = {posture_sig}\n"
+        f"expected_posture_sig = {expected_posture_sig}\n"
+        f"expected_sig = {expected_sig}\n"
+        f"actual_sig = {actual_sig}\n"
+        "\n"
+        "audit_distance_metrics (not used for acceptance):\n"
+        f"first_div_step = {dist['first_div_step']}\n"
+        f"event_divergences_in_overlap = {dist['event_divergences_in_overlap']}\n"
+        f"hist_l1_delta = {dist['hist_l1_delta']}\n"
+        f"expected_events = {dist['expected_events']}\n"
+        f"actual_events = {dist['actual_events']}\n"
+        f"length_delta = {dist['length_delta']}\n"
+        "\n"
+        "trace_stats:\n"
+        f"events_total = {stats['events_total']}\n"
+        f"steps_executed = {stats['steps_executed']}\n"
+    )
+
+
+def write_manifest(folder: str, digests: Dict[str, str]) -> str:
     # Manifest should be stable and not include itself.
+    # digests maps file name -> SHA-256 recorded when the file was written.
+    # Returns the SHA-256 of the manifest itself.
     lines = []
-    for fn in sorted(files):
-        p = os.path.join(folder, fn)
-        h = sha256_file(p)
-        lines.append(f"{h}  {fn}")
-    write_text(os.path.join(folder, "MANIFEST.sha256"), "\n".join(lines) + "\n")
+    for fn in sorted(digests):
+        lines.append(f"{digests[fn]}  {fn}")
+    return write_text_hashed(os.path.join(folder, "MANIFEST.sha256"), "\n".join(lines) + "\n")
 
 
 def run_case(out_dir: str,
@@ -305,121 +444,75 @@ def run_case(out_dir: str,
              posture_id: int,
              tag: str,
              expected_posture_sig: str,
-             expected_sig: str,
-             expected_rows: List[List[str]]) -> Tuple[str, str, Dict[str, int], Dict[str, int]]:
+             expected: Optional[ExpectedTrace]) -> CaseResult:
     """
     Executes one case folder with deterministic artifacts.
-    Returns (decision, actual_sig, stats, dist)
+    expected is the enrollment trace, or None for the ENROLL case itself.
+    Returns (decision, actual_sig, stats, dist, digests), where digests maps
+    every file written to the case folder (MANIFEST included) to its SHA-256.
     """
     case_dir = os.path.join(out_dir, case_name)
     ensure_dir(case_dir)
 
+    expected_sig = expected.sig if expected is not None else ""
+    digests: Dict[str, str] = {}
+    has_expected_rows = expected is not None and len(expected.rows) > 0
+
     psig = posture_signature(posture_id)
     salt = posture_salt(psig)
 
     # Posture admissibility: must match enrolled posture signature
+    # (an inadmissible posture still produces deterministic minimal artifacts)
+    rows, hist, stats = traverse(m, horizon_steps, salt)
+    blob = trace_blob(rows)
+    act_sig = trace_signature(blob)
+
     if psig != expected_posture_sig:
         decision = "ABSTAIN"
         reason = "POSTURE_MISMATCH_INADMISSIBLE"
-        # Still produce deterministic minimal artifacts
-        rows, stats = traverse(m, horizon_steps, salt)
-        act_sig = trace_signature(rows)
-
-        header = ["step", "layer", "event", "x", "gate"]
-        write_csv(os.path.join(case_dir, "ssp_trace.csv"), header, rows)
-
-        dist = distance_metrics(expected_rows, rows) if expected_rows else {
-            "first_div_step": 0, "event_divergences_in_overlap": 0, "hist_l1_delta": 0,
-            "expected_events": 0, "actual_events": len(rows), "length_delta": len(rows)
-        }
-
-        summary = []
-        summary.append(f"SSP Demo {VERSION} — {case_name}")
-        summary.append(f"decision = {decision}")
-        summary.append(f"reason = {reason}")
-        summary.append(f"m = {m}")
-        summary.append(f"horizon_steps = {horizon_steps}")
-        summary.append(f"posture_id = {posture_id}")
-        summary.append(f"posture_sig = {psig}")
-        summary.append(f"expected_posture_sig = {expected_posture_sig}")
-        summary.append(f"expected_sig = {expected_sig}")
-        summary.append(f"actual_sig = {act_sig}")
-        summary.append("")
-        summary.append("audit_distance_metrics (not used for acceptance):")
-        for k in ["first_div_step", "event_divergences_in_overlap", "hist_l1_delta",
-                  "expected_events", "actual_events", "length_delta"]:
-            summary.append(f"{k} = {dist[k]}")
-        summary.append("")
-        summary.append("trace_stats:")
-        summary.append(f"events_total = {stats['events_total']}")
-        summary.append(f"steps_executed = {stats['steps_executed']}")
-        write_text(os.path.join(case_dir, "ssp_summary.txt"), "\n".join(summary) + "\n")
-
-        cfg = build_config_text(mode, m, horizon_steps, posture_id, psig, salt, tag, decision, reason)
-        write_text(os.path.join(case_dir, "SSP_CONFIG.txt"), cfg)
-
-        write_manifest(case_dir, ["ssp_trace.csv", "ssp_summary.txt", "SSP_CONFIG.txt"])
-        return decision, act_sig, stats, dist
-
-    # Admissible posture -> decision by exact signature match
-    rows, stats = traverse(m, horizon_steps, salt)
-    act_sig = trace_signature(rows)
-
-    if expected_sig == "":
+    elif expected is None:
         # enrollment case: record expected signature deterministically
         decision = "OK"
         reason = "ENROLL_RECORDED"
+    elif act_sig == expected_sig:
+        # Admissible posture -> decision by exact signature match
+        decision = "ACCEPT"
+        reason = "EXACT_TRACE_MATCH"
     else:
-        if act_sig == expected_sig:
-            decision = "ACCEPT"
-            reason = "EXACT_TRACE_MATCH"
-        else:
-            decision = "REJECT"
-            reason = "TRACE_MISMATCH"
+        decision = "REJECT"
+        reason = "TRACE_MISMATCH"
 
     header = ["step", "layer", "event", "x", "gate"]
-    write_csv(os.path.join(case_dir, "ssp_trace.csv"), header, rows)
+    digests["ssp_trace.csv"] = write_csv_hashed(os.path.join(case_dir, "ssp_trace.csv"), header, blob)
 
-    dist = distance_metrics(expected_rows, rows) if expected_rows else {
+    dist = distance_metrics(expected, rows, hist) if has_expected_rows else {
         "first_div_step": 0, "event_divergences_in_overlap": 0, "hist_l1_delta": 0,
         "expected_events": 0, "actual_events": len(rows), "length_delta": len(rows)
     }
 
-    summary = []
-    summary.append(f"SSP Demo {VERSION} — {case_name}")
-    summary.append(f"decision = {decision}")
-    summary.append(f"reason = {reason}")
-    summary.append(f"m = {m}")
-    summary.append(f"horizon_steps = {horizon_steps}")
-    summary.append(f"posture_id = {posture_id}")
-    summary.append(f"posture_sig = {psig}")
-    summary.append(f"expected_posture_sig = {expected_posture_sig}")
-    summary.append(f"expected_sig = {expected_sig}")
-    summary.append(f"actual_sig = {act_sig}")
-    summary.append("")
-    summary.append("audit_distance_metrics (not used for acceptance):")
-    for k in ["first_div_step", "event_divergences_in_overlap", "hist_l1_delta",
-              "expected_events", "actual_events", "length_delta"]:
-        summary.append(f"{k} = {dist[k]}")
-    summary.append("")
-    summary.append("trace_stats:")
-    summary.append(f"events_total = {stats['events_total']}")
-    summary.append(f"steps_executed = {stats['steps_executed']}")
-    write_text(os.path.join(case_dir, "ssp_summary.txt"), "\n".join(summary) + "\n")
+    summary = build_summary_text(case_name, decision, reason, m, horizon_steps, posture_id, psig,
+                                 expected_posture_sig, expected_sig, act_sig, dist, stats)
+    digests["ssp_summary.txt"] = write_text_hashed(os.path.join(case_dir, "ssp_summary.txt"), summary)
 
     cfg = build_config_text(mode, m, horizon_steps, posture_id, psig, salt, tag, decision, reason)
-    write_text(os.path.join(case_dir, "SSP_CONFIG.txt"), cfg)
+    digests["SSP_CONFIG.txt"] = write_text_hashed(os.path.join(case_dir, "SSP_CONFIG.txt"), cfg)
 
-    write_manifest(case_dir, ["ssp_trace.csv", "ssp_summary.txt", "SSP_CONFIG.txt"])
-    return decision, act_sig, stats, dist
+    written = dict(digests)
+    written["MANIFEST.sha256"] = write_manifest(case_dir, digests)
+    return decision, act_sig, stats, dist, written
 
 
-def run_demo(out_dir: str,
-             m: int,
-             horizon_steps: int,
-             postures: List[int],
-             attack_deltas: List[int],
-             tag: str) -> None:
+def demo_cases(out_dir: str,
+               m: int,
+               horizon_steps: int,
+               postures: List[int],
+               attack_deltas: List[int],
+               tag: str) -> List[Dict[str, object]]:
+    """
+    Builds the Phase III case list for one demo folder.
+    Each entry holds the keyword arguments of one run_case() call; cases
+    write to distinct folders and share no state, so they may run in any order.
+    """
     ensure_dir(out_dir)
 
     # Phase III demo contract:
@@ -433,11 +526,13 @@ def run_demo(out_dir: str,
     enrolled_salt = posture_salt(enrolled_posture_sig)
 
     # Compute enrollment trace deterministically
-    enroll_rows, _ = traverse(m, horizon_steps, enrolled_salt)
-    expected_sig = trace_signature(enroll_rows)
+    enroll_rows, enroll_hist, _ = traverse(m, horizon_steps, enrolled_salt)
+    expected = expected_trace(enroll_rows, enroll_hist)
+
+    cases: List[Dict[str, object]] = []
 
     # ENROLL
-    run_case(
+    cases.append(dict(
         out_dir=out_dir,
         case_name="ENROLL",
         mode="demo",
@@ -446,12 +541,11 @@ def run_demo(out_dir: str,
         posture_id=p0,
         tag=tag,
         expected_posture_sig=enrolled_posture_sig,
-        expected_sig="",
-        expected_rows=[]
-    )
+        expected=None
+    ))
 
     # AUTH_OK (same posture)
-    run_case(
+    cases.append(dict(
         out_dir=out_dir,
         case_name="AUTH_OK",
         mode="demo",
@@ -460,12 +554,11 @@ def run_demo(out_dir: str,
         posture_id=p0,
         tag=tag,
         expected_posture_sig=enrolled_posture_sig,
-        expected_sig=expected_sig,
-        expected_rows=enroll_rows
-    )
+        expected=expected
+    ))
 
     # AUTH_CROSS (different posture, same m) -> ABSTAIN expected
-    run_case(
+    cases.append(dict(
         out_dir=out_dir,
         case_name=f"AUTH_CROSS_P{p1}",
         mode="demo",
@@ -474,9 +567,8 @@ def run_demo(out_dir: str,
         posture_id=p1,
         tag=tag,
         expected_posture_sig=enrolled_posture_sig,
-        expected_sig=expected_sig,
-        expected_rows=enroll_rows
-    )
+        expected=expected
+    ))
 
     # Attacks (posture p0 and p1)
     for d in attack_deltas:
@@ -484,7 +576,7 @@ def run_demo(out_dir: str,
             continue
         mm = m + d
         name = f"ATTACK_M{'PLUS' if d > 0 else 'MINUS'}{abs(d)}_P{p0}"
-        run_case(
+        cases.append(dict(
             out_dir=out_dir,
             case_name=name,
             mode="demo",
@@ -493,12 +585,11 @@ def run_demo(out_dir: str,
             posture_id=p0,
             tag=tag,
             expected_posture_sig=enrolled_posture_sig,
-            expected_sig=expected_sig,
-            expected_rows=enroll_rows
-        )
+            expected=expected
+        ))
 
         name2 = f"ATTACK_M{'PLUS' if d > 0 else 'MINUS'}{abs(d)}_P{p1}"
-        run_case(
+        cases.append(dict(
             out_dir=out_dir,
             case_name=name2,
             mode="demo",
@@ -507,12 +598,52 @@ def run_demo(out_dir: str,
             posture_id=p1,
             tag=tag,
             expected_posture_sig=enrolled_posture_sig,
-            expected_sig=expected_sig,
-            expected_rows=enroll_rows
-        )
+            expected=expected
+        ))
+
+    return cases
+
+
+def _run_case_worker(kwargs: Dict[str, object]) -> CaseResult:
+    # Module-level so it can be pickled into worker processes
+    return run_case(**kwargs)
+
+
+def run_cases(cases: List[Dict[str, object]],
+              jobs: int = 1) -> List[CaseResult]:
+    """
+    Executes independent cases in-process by default. jobs > 1 opts in to a
+    worker process pool (jobs = 0 uses one worker per CPU); a pool that would
+    get a single worker is skipped. Results are returned in case order.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(cases) <= 1:
+        return [run_case(**c) for c in cases]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_run_case_worker, cases))
+
+
+def case_digests(cases: List[Dict[str, object]],
+                 results: List[CaseResult]) -> Dict[str, Dict[str, str]]:
+    # case name -> file name -> SHA-256, as recorded while writing
+    return {str(c["case_name"]): r[4] for c, r in zip(cases, results)}
+
+
+def run_demo(out_dir: str,
+             m: int,
+             horizon_steps: int,
+             postures: List[int],
+             attack_deltas: List[int],
+             tag: str,
+             jobs: int = 1) -> Dict[str, Dict[str, str]]:
+    cases = demo_cases(out_dir, m, horizon_steps, postures, attack_deltas, tag)
+    return case_digests(cases, run_cases(cases, jobs))
 
 
 def main() -> int:
+    # CLI-only import: spawned pool workers import this module but never parse args
+    import argparse
     ap = argparse.ArgumentParser()
     ap.add_argument("--mode", choices=["demo"], default="demo")
     ap.add_argument("--m", type=int, required=True)
@@ -522,12 +653,17 @@ def main() -> int:
     ap.add_argument("--tag", type=str, default="V03_DEMO")
     ap.add_argument("--out_root", type=str, default=os.path.join("outputs", "ssp_out"))
     ap.add_argument("--verify_replay", action="store_true")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="worker processes for case runs (1 = run in-process, 0 = one per CPU)")
     args = ap.parse_args()
 
     tag = args.tag.strip()
     if not tag:
         print("ERROR: empty --tag", file=sys.stderr)
         return 2
+    if args.jobs < 0:
+        print("ERROR: --jobs must be >= 0", file=sys.stderr)
+        return 2
 
     out_root = args.out_root
     ensure_dir(out_root)
@@ -539,12 +675,18 @@ def main() -> int:
         rm_tree(a_dir)
         rm_tree(b_dir)
 
-        run_demo(a_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag)
-        run_demo(b_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag)
-
-        ok, why = compare_trees(a_dir, b_dir)
-        if not ok:
-            print(f"VERIFY_REPLAY: FAIL ({why})")
+        # Both replays are independent; run their cases in one pool
+        a_cases = demo_cases(a_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag)
+        b_cases = demo_cases(b_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag)
+        results = run_cases(a_cases + b_cases, args.jobs)
+        a_digests = case_digests(a_cases, results[:len(a_cases)])
+        b_digests = case_digests(b_cases, results[len(a_cases):])
+
+        # Every artifact was hashed as it was written, so identical digest maps
+        # mean byte-identical trees; the trees are only re-read to locate a mismatch.
+        if a_digests != b_digests:
+            _, why = compare_trees(a_dir, b_dir)
+            print(f"VERIFY_REPLAY: FAIL ({why or 'artifact digest mismatch'})")
             return 1
 
         print("VERIFY_REPLAY: PASS (all CSV/TXT/CONFIG/MANIFEST outputs byte-identical)")
@@ -558,7 +700,7 @@ def main() -> int:
     ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     run_dir = os.path.join(out_root, f"{ts}__{ENGINE_TAG}__{tag}")
     rm_tree(run_dir)
-    run_demo(run_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag)
+    run_demo(run_dir, args.m, args.horizon_steps, args.postures, args.attack_deltas, tag, args.jobs)
 
     print(f"OK: SSP demo {VERSION} complete")
     print(f"Output folder: {run_dir}")